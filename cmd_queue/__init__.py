@@ -105,14 +105,17 @@ Example:
     # Jobs
     # ----
     #
-    ### Command 1 / 3 - jobX
+    ### Command 1 / 4 - jobX
     echo "Hello Barrette" && sleep 0.1
     #
-    ### Command 2 / 3 - jobY
+    ### Command 2 / 4 - jobY
     echo "Hello Overwrite" && sleep 0.1
     #
-    ### Command 3 / 3 - jobZ
+    ### Command 3 / 4 - jobZ
     echo "Hello Giblet" && sleep 0.1
+    #
+    ### Command 4 / 4 - job3
+    echo "Hello Excavate" && sleep 0.1
     # --- ...sh
     #!/bin/bash
     # Written by cmd_queue ...
@@ -133,33 +136,16 @@ Example:
     echo "Hello Shadow" && sleep 0.1
     # --- ...sh
     #!/bin/bash
-    # Written by cmd_queue ...
-    # ----
-    # Jobs
-    # ----
-    #
-    ### Command 1 / 1 - job3
-    echo "Hello Excavate" && sleep 0.1
-    # --- ...sh
-    #!/bin/bash
     # Driver script to start the tmux-queue
     echo "Submitting 8 jobs to a tmux queue"
-    ### Run Queue: cmdq_unnamed_000_... with 3 jobs
-    tmux new-session -d -s cmdq_unnamed_000_... "bash"
-    tmux send -t cmdq_unnamed_... \
-        "source ...sh" \
-        Enter
+    ### Run Queue: cmdq_unnamed_000_... with 4 jobs
     ### Run Queue: cmdq_unnamed_001_... with 4 jobs
-    tmux new-session -d -s cmdq_unnamed_001_... "bash"
-    tmux send -t cmdq_unnamed_001_... \
-        "source ...sh" \
-        Enter
-    ### Run Queue: cmdq_unnamed_002_... with 1 jobs
-    tmux new-session -d -s cmdq_unnamed_002_... "bash"
-    tmux send -t cmdq_unnamed_... \
-        "source ...sh" \
-        Enter
-    echo "Spread jobs across 3 tmux workers"
+    tmux \
+        new-session -d -s cmdq_unnamed_000_... "bash" \; \
+        send -t cmdq_unnamed_000_... "source ...sh" Enter \; \
+        new-session -d -s cmdq_unnamed_001_... "bash" \; \
+        send -t cmdq_unnamed_001_... "source ...sh" Enter
+    echo "Spread jobs across 2 tmux workers"
     >>> # The slurm queue is very simple, it just constructs one bash file that is the
     >>> # sbatch commands to submit your jobs. All of the other details are taken care of
     >>> # by slurm itself.
@@ -1,5 +1,12 @@
+import os
+import stat
 import ubelt as ub
 
+# Permissions for written scripts: rwx for the user, rwx for the group
+_SCRIPT_MODE = (
+    stat.S_IXUSR | stat.S_IXGRP | stat.S_IRUSR |
+    stat.S_IWUSR | stat.S_IRGRP | stat.S_IWGRP)
+
 
 class DuplicateJobError(KeyError):
     ...
@@ -38,6 +45,8 @@ class Queue(ub.NiceRepr):
         self.num_real_jobs = 0
         self.all_depends = None
         self.named_jobs = {}
+        # The last (jobs key, graph) built by _dependency_graph
+        self._graph_cache = None
 
     def change_backend(self, backend, **kwargs):
         """
@@ -104,16 +113,27 @@ class Queue(ub.NiceRepr):
         Writes the underlying files that defines the queue for whatever program
         will ingest it to run it.
         """
-        import os
-        import stat
-        text = self.finalize_text()
         self.fpath.parent.ensuredir()
-        self.fpath.write_text(text)
-        os.chmod(self.fpath, (
-            stat.S_IXUSR | stat.S_IXGRP | stat.S_IRUSR |
-            stat.S_IWUSR | stat.S_IRGRP | stat.S_IWGRP))
+        with open(self.fpath, 'w') as file:
+            for chunk in self._iter_text_chunks():
+                file.write(chunk)
+            if hasattr(os, 'fchmod'):
+                # Use the open handle to avoid another path lookup
+                os.fchmod(file.fileno(), _SCRIPT_MODE)
+        if not hasattr(os, 'fchmod'):
+            os.chmod(self.fpath, _SCRIPT_MODE)
         return self.fpath
 
+    def _iter_text_chunks(self, **kwargs):
+        """
+        Generate the pieces of text that :func:`write` streams to disk.
+        Backends can override this to avoid building the full text in memory.
+
+        Args:
+            **kwargs: passed to :func:`finalize_text`
+        """
+        yield self.finalize_text(**kwargs)
+
     def submit(self, command, **kwargs):
         """
         Args:
@@ -316,11 +336,19 @@ class Queue(ub.NiceRepr):
 
         from cmd_queue.util import util_tags
         exclude_tags = util_tags.Tags.coerce(exclude_tags)
-        code = self.finalize_text(
+        finalize_kw = dict(
             with_status=with_status,
             with_gaurds=with_gaurds,
             with_locks=with_locks,
             exclude_tags=exclude_tags)
+        if style == 'plain':
+            # Plain text can be streamed without building the full script
+            print(f'# --- {str(self.fpath)}')
+            for chunk in self._iter_text_chunks(**finalize_kw):
+                print(chunk, end='')
+            print()
+            return
+        code = self.finalize_text(**finalize_kw)
         if style == 'rich':
             from rich.syntax import Syntax
             from rich.panel import Panel
@@ -330,9 +358,6 @@ class Queue(ub.NiceRepr):
         elif style == 'colors':
             print(ub.highlight_code(f'# --- {str(self.fpath)}', 'bash'))
             print(ub.highlight_code(code, 'bash'))
-        elif style == 'plain':
-            print(f'# --- {str(self.fpath)}')
-            print(code)
         else:
             raise KeyError(f'Unknown style={style}')
 
@@ -352,9 +377,20 @@ class Queue(ub.NiceRepr):
         """
         self.write_network_text(reduced=reduced, vertical_chains=vertical_chains)
 
+    def _jobs_key(self):
+        """
+        A key that changes whenever the dependency graph of the jobs could.
+        """
+        return tuple(
+            (id(job), job.name, tuple(id(dep) for dep in (job.depends or ())))
+            for job in self.jobs)
+
     def _dependency_graph(self):
         """
-        Builds a networkx dependency graph for the current jobs
+        Builds a networkx dependency graph for the current jobs.
+
+        The graph is reused until the jobs or their dependencies change, so
+        callers must not modify it.
 
         Example:
             >>> from cmd_queue import Queue
@@ -369,7 +405,16 @@ class Queue(ub.NiceRepr):
             >>> jobZ = self.submit('echo hello && sleep 0.5', depends=[jobY])
             >>> graph = self._dependency_graph()
             >>> self.print_graph()
+            >>> assert self._dependency_graph() is graph
+            >>> jobW = self.submit('echo hello && sleep 0.5', depends=[jobZ])
+            >>> assert self._dependency_graph() is not graph
         """
+        jobs_key = self._jobs_key()
+        if self._graph_cache is not None:
+            cached_key, cached_graph = self._graph_cache
+            if cached_key == jobs_key:
+                return cached_graph
+
         import networkx as nx
         graph = nx.DiGraph()
         duplicate_names = ub.find_duplicates(self.jobs, key=lambda x: x.name)
@@ -384,6 +429,7 @@ class Queue(ub.NiceRepr):
                 for dep in job.depends:
                     if dep is not None:
                         graph.add_edge(dep.name, job.name)
+        self._graph_cache = (jobs_key, graph)
         return graph
 
     def monitor(self):
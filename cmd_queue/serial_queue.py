@@ -41,6 +41,11 @@ class BashJob(base_queue.Job):
             In that case ensure this is False at the cost of readability in the
             result script.
 
+        cost (float | None):
+            an estimate of how expensive this job is relative to the other
+            jobs (e.g. its expected runtime). The tmux backend uses this to
+            balance work across its workers. Defaults to 1 if unspecified.
+
     TODO:
         - [ ] What is a good name for a a list of jobs that must fail
               for this job to run. Our current depends in analogous to slurm's
@@ -70,7 +75,7 @@ class BashJob(base_queue.Job):
     """
     def __init__(self, command, name=None, depends=None, gpus=None, cpus=None,
                  mem=None, bookkeeper=0, info_dpath=None, log=False, tags=None,
-                 allow_indent=True, **kwargs):
+                 allow_indent=True, cost=None, **kwargs):
 
         if depends is not None and not ub.iterable(depends):
             depends = [depends]
@@ -90,6 +95,7 @@ class BashJob(base_queue.Job):
         self.log_fpath = self.info_dpath / f'status/{self.pathid}.logs'
         self.tags = util_tags.Tags.coerce(tags)
         self.allow_indent = allow_indent
+        self.cost = cost
 
     def _test_bash_syntax_errors(self):
         """
@@ -367,6 +373,9 @@ class SerialQueue(base_queue.Queue):
         self.cwd = cwd
         self.job_info_dpath = self.dpath / 'job_info'
 
+        # Tuple of (stat key, state) from the last read of the state file
+        self._state_cache = None
+
     @property
     def pathid(self):
         """ A path-safe identifier for file names """
@@ -641,9 +650,40 @@ class SerialQueue(base_queue.Queue):
                 print(job.log_fpath.read_text())
             print('L________')
 
-    def read_state(self):
+    def read_state(self, prefetched_stat=None):
+        """
+        Read the json status file written by the running queue.
+
+        Args:
+            prefetched_stat (os.stat_result | None):
+                the stat of :attr:`state_fpath` if the caller already has it
+                (e.g. from a directory scan). If the file has not changed
+                since it was last read, the previous state is returned without
+                opening the file.
+
+        Returns:
+            Dict: the status of this queue
+
+        Example:
+            >>> from cmd_queue.serial_queue import *  # NOQA
+            >>> import os
+            >>> self = SerialQueue('test-serial-read-state')
+            >>> self.submit('echo hi')
+            >>> self.run(verbose=0)
+            >>> state1 = self.read_state(os.stat(self.state_fpath))
+            >>> assert state1['status'] == 'done'
+            >>> state2 = self.read_state(os.stat(self.state_fpath))
+            >>> assert state2 == state1
+        """
         import json
         import time
+        stat_key = None
+        if prefetched_stat is not None:
+            stat_key = (prefetched_stat.st_mtime_ns, prefetched_stat.st_size)
+            if self._state_cache is not None:
+                cached_key, cached_state = self._state_cache
+                if cached_key == stat_key:
+                    return cached_state
         max_attempts = 100
         num_attempts = 0
         while True:
@@ -667,6 +707,12 @@ class SerialQueue(base_queue.Queue):
                 time.sleep(0.01)
                 continue
             break
+        if stat_key is not None and state['status'] != 'unknown':
+            # Only trust the cache for files that were not modified very
+            # recently, otherwise a second write within the timestamp
+            # resolution of the filesystem could go unnoticed.
+            if time.time_ns() - prefetched_stat.st_mtime_ns > 1e9:
+                self._state_cache = (stat_key, state)
         return state
 
 
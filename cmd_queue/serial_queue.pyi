@@ -1,3 +1,5 @@
+import os
+from typing import Dict
 from typing import List
 from os import PathLike
 from _typeshed import Incomplete
@@ -18,6 +20,7 @@ class BashJob(base_queue.Job):
     log: bool
     tags: List[str] | str | None
     allow_indent: bool
+    cost: float | None
     kwargs: Incomplete
     pass_fpath: Incomplete
     fail_fpath: Incomplete
@@ -36,6 +39,7 @@ class BashJob(base_queue.Job):
                  log: bool = ...,
                  tags: Incomplete | None = ...,
                  allow_indent: bool = ...,
+                 cost: float | None = ...,
                  **kwargs) -> None:
         ...
 
@@ -120,5 +124,5 @@ class SerialQueue(base_queue.Queue):
     def job_details(self) -> None:
         ...
 
-    def read_state(self):
+    def read_state(self, prefetched_stat: os.stat_result | None = None) -> Dict:
         ...
@@ -35,6 +35,11 @@ Example:
     >>>     else:
     >>>         print('output does not exist')
 """
+import io
+import json
+import shlex
+import time
+import uuid
 import ubelt as ub
 
 from cmd_queue import base_queue  # NOQA
@@ -232,7 +237,6 @@ class SlurmJob(base_queue.Job):
                  tags=None, **kwargs):
         super().__init__()
         if name is None:
-            import uuid
             name = 'job-' + str(uuid.uuid4())
         if depends is not None and not ub.iterable(depends):
             depends = [depends]
@@ -353,7 +357,6 @@ class SlurmJob(base_queue.Job):
             else:
                 sbatch_args.append(f'"--begin={self.begin}"')
 
-        import shlex
         wrp_command = shlex.quote(self.command)
 
         if self.shell:
@@ -414,8 +417,6 @@ class SlurmQueue(base_queue.Queue):
     """
     def __init__(self, name=None, shell=None, **kwargs):
         super().__init__()
-        import uuid
-        import time
         self.jobs = []
         if name is None:
             name = 'SQ'
@@ -463,7 +464,6 @@ class SlurmQueue(base_queue.Queue):
         status['sinfo_working'] = False
         if sinfo['ret'] == 0:
             status['sinfo_working'] = True
-            import json
             sinfo_out = json.loads(sinfo['out'])
             has_working_nodes = not all(
                 node['state'] == 'down'
@@ -492,7 +492,6 @@ class SlurmQueue(base_queue.Queue):
                     else:
                         sinfo = ub.cmd('sinfo --json')
                         if sinfo['ret'] == 0:
-                            import json
                             sinfo_out = json.loads(sinfo['out'])
                             has_working_nodes = not all(
                                 node['state'] == 'down'
@@ -587,11 +586,9 @@ class SlurmQueue(base_queue.Queue):
         """
         Monitor progress until the jobs are done
         """
-
-        import time
         from rich.live import Live
+        from rich.prompt import Confirm
         from rich.table import Table
-        import io
         import pandas as pd
         jobid_history = set()
 
@@ -627,42 +624,75 @@ class SlurmQueue(base_queue.Queue):
             if num_at_start is None:
                 num_at_start = len(df)
 
-            table = Table(*['num_running', 'num_in_queue', 'total_monitored', 'num_at_start'],
-                          title='slurm-monitor')
-
             # TODO: determine if slurm has accounting on, and if we can
             # figure out how many jobs errored / passed
-
-            table.add_row(
-                f'{num_running}',
-                f'{num_in_queue}',
-                f'{total_monitored}',
-                f'{num_at_start}',
+            counts = (
+                int(num_running),
+                num_in_queue,
+                total_monitored,
+                num_at_start,
             )
-
             finished = (num_in_queue == 0)
-            return table, finished
+            return counts, finished
+
+        header = ['num_running', 'num_in_queue', 'total_monitored', 'num_at_start']
+
+        def build_table(counts):
+            table = Table(title='slurm-monitor')
+            # Fixed widths let rich skip measuring the cells on every redraw
+            for col in header:
+                table.add_column(col, width=max(len(col), 8), no_wrap=True)
+            # Formatting is deferred until we know the counts changed
+            table.add_row(*map(str, counts))
+            return table
 
         try:
-            table, finished = update_status_table()
-            refresh_rate = 0.4
+            counts, finished = update_status_table()
+            table = build_table(counts)
+            # Back off polling while nothing changes, reset when it does
+            poll_interval = refresh_rate
+            max_poll_interval = max(refresh_rate, 5.0)
             with Live(table, refresh_per_second=4) as live:
                 while not finished:
-                    time.sleep(refresh_rate)
-                    table, finished = update_status_table()
-                    live.update(table)
+                    time.sleep(poll_interval)
+                    new_counts, finished = update_status_table()
+                    # Only hand rich a new table when something changed
+                    if new_counts != counts:
+                        counts = new_counts
+                        table = build_table(counts)
+                        live.update(table)
+                        poll_interval = refresh_rate
+                    else:
+                        poll_interval = min(poll_interval * 1.5, max_poll_interval)
         except KeyboardInterrupt:
-            from rich.prompt import Confirm
             flag = Confirm.ask('do you to kill the procs?')
             if flag:
                 self.kill()
 
     def kill(self):
-        cancel_commands = []
-        for job in self.jobs:
-            cancel_commands.append(f'scancel --name="{job.name}"')
-        for cmd in cancel_commands:
-            ub.cmd(cmd, verbose=2)
+        if not self.jobs:
+            return
+        # scancel --name only takes a single name, but squeue --name accepts
+        # a comma separated list, so resolve the job ids and cancel them all
+        # with one scancel call.
+        names = ','.join(job.name for job in self.jobs)
+        info = ub.cmd(f'squeue -h -o %i --name={shlex.quote(names)}')
+        if info['ret'] == 0:
+            jobids = info['out'].split()
+            if jobids:
+                ub.cmd(['scancel'] + jobids, verbose=2)
+        else:
+            # Fallback to cancelling each job by name
+            # The individual calls are independent, so overlap them.
+            cancel_commands = []
+            for job in self.jobs:
+                cancel_commands.append(f'scancel --name="{job.name}"')
+            max_workers = min(16, len(cancel_commands))
+            with ub.Executor(mode='thread', max_workers=max_workers) as executor:
+                futures = [executor.submit(ub.cmd, cmd, verbose=2)
+                           for cmd in cancel_commands]
+                for future in futures:
+                    future.result()
 
     def read_state(self):
         # Not possible to get full info, but we probably could do better than
@@ -16,8 +16,29 @@ Helper script to wrap a command with sbatch, but using a more srun like syntax.
             python -c 'import sys; print("hello world"); sys.exit(0)'
 """
 #!/usr/bin/env python3
+import rich
 import scriptconfig as scfg
+import shlex
+import string
 import ubelt as ub
+from rich.markup import escape
+
+
+# Characters that shlex.quote considers safe to leave unquoted
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + '@%+=:,./-_')
+
+
+def _needs_quote(text):
+    """
+    Fast check for if :func:`shlex.quote` would modify the input.
+
+    Example:
+        >>> from cmd_queue.slurmify import _needs_quote
+        >>> import shlex
+        >>> for text in ['', 'echo', 'a b', 'x=1,y/z', "it's"]:
+        >>>     assert _needs_quote(text) == (shlex.quote(text) != text)
+    """
+    return not text or not all(c in _SAFE_CHARS for c in text)
 
 
 class SlurmifyCLI(scfg.DataConfig):
@@ -57,8 +78,6 @@ class SlurmifyCLI(scfg.DataConfig):
             >>> cls = SlurmifyCLI
             >>> cls.main(cmdline=cmdline, **kwargs)
         """
-        import rich
-        from rich.markup import escape
         config = cls.cli(cmdline=cmdline, data=kwargs, strict=True)
         rich.print('config = ' + escape(ub.urepr(config, nl=1)))
 
@@ -86,13 +105,11 @@ class SlurmifyCLI(scfg.DataConfig):
             if isinstance(bash_command, list):
                 if len(bash_command) == 1:
                     # hack
-                    import shlex
-                    if shlex.quote(bash_command[0]) == bash_command[0]:
+                    if not _needs_quote(bash_command[0]):
                         bash_command = bash_command[0]
                     else:
                         bash_command = shlex.quote(bash_command[0])
                 else:
-                    import shlex
                     bash_command = ' '.join([shlex.quote(str(p)) for p in bash_command])
             submitkw = ub.udict(row) & {'name', 'depends'}
             queue.submit(bash_command, log=False, **submitkw)
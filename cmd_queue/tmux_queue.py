@@ -48,14 +48,126 @@ Example:
     >>>     queue.run()
 
 """
+import functools
+import itertools as it
+import os
+import re
+import shlex
+import time
 import ubelt as ub
-# import itertools as it
 import uuid
 
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
 from cmd_queue import base_queue
 from cmd_queue import serial_queue
+from cmd_queue.util.util_algo import _greedy_partition_ordered
 from cmd_queue.util.util_tmux import tmux
 
+try:
+    from functools import cache  # Python 3.9+ only
+except ImportError:
+    from ubelt import memoize as cache
+
+
+@cache
+def _find_exe(name):
+    """
+    Like :func:`ubelt.find_exe`, but only searches the PATH once per process.
+    """
+    return ub.find_exe(name)
+
+
+def _partition_weights(group_weights, num_parts):
+    """
+    Memoized :func:`balanced_number_partitioning`. Ranks of wide graphs often
+    have the same group weights in a different order, so the weights are
+    sorted before the cache lookup and the partition is mapped back to the
+    original indexes.
+
+    Args:
+        group_weights (Tuple[int, ...]): weight of each group
+        num_parts (int): number of partitions
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: group indexes assigned to each partition
+
+    Example:
+        >>> from cmd_queue.tmux_queue import _partition_weights
+        >>> _partition_weights((1, 1, 3), 2)
+        ((2,), (1, 0))
+        >>> _partition_weights((3, 1, 1), 2)
+        ((0,), (2, 1))
+    """
+    import numpy as np
+    # Same descending order balanced_number_partitioning uses, so the result
+    # is identical to partitioning the weights directly.
+    sortx = np.argsort(np.asanyarray(group_weights))[::-1].tolist()
+    sorted_weights = tuple(group_weights[idx] for idx in sortx)
+    sorted_parts = _partition_sorted_weights(sorted_weights, num_parts)
+    return tuple(tuple(sortx[pos] for pos in part) for part in sorted_parts)
+
+
+@functools.lru_cache(maxsize=512)
+def _partition_sorted_weights(sorted_weights, num_parts):
+    parts = _greedy_partition_ordered(sorted_weights, num_parts)
+    return tuple(tuple(part) for part in parts)
+
+
+# Templates for the generated bash are dedented once at import time
+
+_DRIVER_HEADER_TEMPLATE = ub.codeblock(
+    '''
+    #!/bin/bash
+    # Driver script to start the tmux-queue
+    echo "Submitting {num_jobs} jobs to a tmux queue"
+    ''')
+
+_RUN_WORKER_COMMENT_TEMPLATE = '### Run Queue: {pathid} with {num_jobs} jobs'
+
+# The commands for all workers are chained into a single tmux invocation
+_RUN_WORKER_TEMPLATE = ub.codeblock(
+    '''
+    new-session -d -s {pathid} "bash" \\; \\
+    send -t {pathid} "source {fpath}" Enter
+    ''')
+
+# Exit code 2 from inotifywait means the timeout expired, anything else
+# nonzero is an error, in which case we degrade to polling.
+_SEMAPHORE_INOTIFY_WAIT_TEMPLATE = ub.codeblock(
+    '''
+    printf "{msg} "
+    mkdir -p {watch_dpaths}
+    while {condition};
+    do
+       inotifywait -qq -t 5 -e create,moved_to {watch_dpaths} || [ $? -eq 2 ] || sleep 1;
+    done
+    printf "finished {msg} "
+    ''')
+
+_SEMAPHORE_POLL_WAIT_TEMPLATE = ub.codeblock(
+    '''
+    printf "{msg} "
+    while {condition};
+    do
+       sleep 1;
+    done
+    printf "finished {msg} "
+    ''')
+
+# Below this many workers the state files are read serially, a thread pool
+# costs more than it hides.
+_MIN_POOL_READ_WORKERS = 8
+
+# Style of the "passed" cell in the status table for each worker status
+_STATUS_PASS_STYLES = {
+    'unknown': 'yellow',
+    'done': 'green',
+}
+
 
 class TMUXMultiQueue(base_queue.Queue):
     """
@@ -195,7 +307,7 @@ class TMUXMultiQueue(base_queue.Queue):
         >>>     self.run(with_textual=False, check_other_sessions=0)
     """
     def __init__(self, size=1, name=None, dpath=None, rootid=None, environ=None,
-                 gpus=None, gres=None):
+                 gpus=None, gres=None, split_gpus=False):
         super().__init__()
 
         if rootid is None:
@@ -206,7 +318,8 @@ class TMUXMultiQueue(base_queue.Queue):
         self.rootid = rootid
         self.pathid = '{}_{}'.format(self.name, self.rootid)
         if dpath is None:
-            dpath = ub.Path.appdir('cmd_queue/tmux').ensuredir()
+            dpath = ub.Path.appdir('cmd_queue/tmux')
+        # Creates the parent directories too, so only one mkdir is needed
         self.dpath = (ub.Path(dpath) / self.pathid).ensuredir()
 
         if environ is None:
@@ -224,6 +337,8 @@ class TMUXMultiQueue(base_queue.Queue):
             gpus = gres
 
         self.gpus = gpus
+        # If True, extra GPUs are divided between the workers (see _new_workers)
+        self.split_gpus = split_gpus
 
         self.cmd_verbose = 2
 
@@ -233,6 +348,29 @@ class TMUXMultiQueue(base_queue.Queue):
         self._tmux_session_prefix = 'cmdq_'
         self.job_info_dpath = self.dpath / 'job_info'
 
+        # If available, semaphores block on inotify instead of polling
+        self._has_inotifywait = bool(_find_exe('inotifywait'))
+
+        # The result of order_jobs is reused until the jobs change
+        self._order_cache_key = None
+
+        # The last (timestamp, result) of _build_status_rows
+        self._status_cache = None
+        # The last (rows, table) of _update_status_table
+        self._status_table_cache = None
+        # Running (passed, failed, skipped, total) totals over self.workers,
+        # and the last (state, row, counts) seen for each worker.
+        self._agg_workers = None
+        self._agg_counts = None
+        self._worker_status = None
+        # The last (timestamp, sessions) of _tmux_current_sessions
+        self._sessions_cache = None
+        # The workers whose final states are known, and the last state read
+        # for each worker (see _read_worker_states).
+        self._frozen_workers = None
+        self._frozen_states = None
+        self._last_worker_states = None
+
         self._new_workers()
 
     @classmethod
@@ -240,18 +378,41 @@ class TMUXMultiQueue(base_queue.Queue):
         """
         Determines if we can run the tmux queue or not.
         """
-        return ub.find_exe('tmux')
+        return _find_exe('tmux')
 
     def _new_workers(self, start=0):
-        import itertools as it
+        """
+        Create one serial queue per slot.
+
+        If gpus were given, each worker sees one of them via
+        ``CUDA_VISIBLE_DEVICES``, assigned round-robin. If ``split_gpus`` is
+        True and there are more GPUs than workers, each worker instead gets a
+        contiguous share of the GPUs so no GPU is left idle.
+
+        Example:
+            >>> from cmd_queue.tmux_queue import *  # NOQA
+            >>> self = TMUXMultiQueue(2, 'test-new-workers', gpus=[0, 1, 2, 3, 4])
+            >>> print([w.environ['CUDA_VISIBLE_DEVICES'] for w in self._new_workers()])
+            ['0', '1']
+            >>> self.split_gpus = True
+            >>> print([w.environ['CUDA_VISIBLE_DEVICES'] for w in self._new_workers()])
+            ['0,1', '2,3,4']
+            >>> self = TMUXMultiQueue(3, 'test-new-workers', gpus=[0, 1], split_gpus=True)
+            >>> print([w.environ['CUDA_VISIBLE_DEVICES'] for w in self._new_workers()])
+            ['0', '1', '0']
+        """
         per_worker_environs = [self.environ] * self.size
         if self.gpus:
-            # TODO: more sophisticated GPU policy?
+            gpus = list(self.gpus)
+            if self.split_gpus and len(gpus) > self.size:
+                bounds = [len(gpus) * idx // self.size
+                          for idx in range(self.size + 1)]
+                worker_gpus = [gpus[a:b] for a, b in zip(bounds, bounds[1:])]
+            else:
+                worker_gpus = [[cvd] for cvd in it.islice(it.cycle(gpus), self.size)]
             per_worker_environs = [
-                ub.dict_union(e, {
-                    'CUDA_VISIBLE_DEVICES': str(cvd),
-                })
-                for cvd, e in zip(it.cycle(self.gpus), per_worker_environs)
+                {**e, 'CUDA_VISIBLE_DEVICES': ','.join(map(str, cvds))}
+                for cvds, e in zip(worker_gpus, per_worker_environs)
             ]
 
         workers = [
@@ -268,9 +429,26 @@ class TMUXMultiQueue(base_queue.Queue):
     def __nice__(self):
         return ub.repr2(self.jobs)
 
+    def submit(self, command, **kwargs):
+        self._order_cache_key = None
+        return super().submit(command, **kwargs)
+
+    def _order_jobs_key(self):
+        """
+        A key that changes whenever the result of :func:`order_jobs` could.
+        """
+        return (self.size, tuple(self.header_commands), self._jobs_key())
+
     def _semaphore_wait_command(self, flag_fpaths, msg):
         r"""
-        TODO: use flock? or inotify?
+        Build the bash that blocks until all of the flags exist.
+
+        Each item of ``flag_fpaths`` is either a path or a tuple of paths, in
+        which case the flag is raised when any one of them exists.
+
+        If ``inotifywait`` is available the loop sleeps in the kernel until
+        an entry is created in the flag directories (with a timeout as a
+        safety net against missed events), otherwise it polls once per second.
 
         Ignore:
 
@@ -292,34 +470,37 @@ class TMUXMultiQueue(base_queue.Queue):
 
         Example:
             >>> from cmd_queue.tmux_queue import *  # NOQA
-            >>> flag_fpaths = ['foo.txt']
+            >>> self = TMUXMultiQueue(1, 'test-semaphore-wait')
+            >>> flag_fpaths = [self.dpath / 'foo.done',
+            >>>                (self.dpath / 'bar.pass', self.dpath / 'bar.fail')]
             >>> msg = 'waiting'
-            >>> command = TMUXMultiQueue._semaphore_wait_command(None, flag_fpaths, msg)
+            >>> self._has_inotifywait = False
+            >>> command = self._semaphore_wait_command(flag_fpaths, msg)
+            >>> print(command)
+            >>> self._has_inotifywait = True
+            >>> command = self._semaphore_wait_command(flag_fpaths, msg)
             >>> print(command)
         """
-        # TODO: use inotifywait
-        conditions = ['[ ! -f {} ]'.format(p) for p in flag_fpaths]
+        flag_groups = [p if isinstance(p, tuple) else (p,) for p in flag_fpaths]
+        conditions = []
+        for group in flag_groups:
+            if len(group) == 1:
+                conditions.append('[ ! -e {} ]'.format(group[0]))
+            else:
+                conditions.append('{ ' + ' && '.join(
+                    '[ ! -e {} ]'.format(p) for p in group) + '; }')
         condition = ' || '.join(conditions)
         # TODO: count number of files that exist
-        command = ub.codeblock(
-            f'''
-            printf "{msg} "
-            while {condition};
-            do
-               sleep 1;
-            done
-            printf "finished {msg} "
-            ''')
+        if self._has_inotifywait:
+            watch_dpaths = ' '.join(ub.unique(
+                str(ub.Path(p).parent) for p in it.chain.from_iterable(flag_groups)))
+            command = _SEMAPHORE_INOTIFY_WAIT_TEMPLATE.format(
+                msg=msg, condition=condition, watch_dpaths=watch_dpaths)
+        else:
+            command = _SEMAPHORE_POLL_WAIT_TEMPLATE.format(
+                msg=msg, condition=condition)
         return command
 
-    def _semaphore_signal_command(self, flag_fpath):
-        return ub.codeblock(
-            f'''
-            # Signal this worker is complete
-            mkdir -p {flag_fpath.parent} && touch {flag_fpath}
-            '''
-        )
-
     def order_jobs(self):
         """
         TODO: ability to shuffle jobs subject to graph constraints
@@ -406,14 +587,56 @@ class TMUXMultiQueue(base_queue.Queue):
             >>> self.submit('echo fast4', name='fast4')
             >>> self.print_graph(reduced=False)
             >>> self.print_commands()
+
+        Example:
+            >>> # Job costs are used to balance the work between workers
+            >>> from cmd_queue.tmux_queue import *  # NOQA
+            >>> self = TMUXMultiQueue(2, 'test-order-cost')
+            >>> self.submit('sleep 3', name='slow', cost=3)
+            >>> self.submit('sleep 1', name='fast1')
+            >>> self.submit('sleep 1', name='fast2')
+            >>> self.submit('sleep 1', name='fast3')
+            >>> self.order_jobs()
+            >>> print([[job.name for job in w.jobs] for w in self.workers])
+            [['slow'], ['fast1', 'fast2', 'fast3']]
+
+        Example:
+            >>> # Repeated calls reuse the workers until the jobs change
+            >>> from cmd_queue.tmux_queue import *  # NOQA
+            >>> self = TMUXMultiQueue(2, 'test-order-cache')
+            >>> job1 = self.submit('echo hi 1')
+            >>> self.order_jobs()
+            >>> workers1 = self.workers
+            >>> self.order_jobs()
+            >>> assert self.workers is workers1
+            >>> job2 = self.submit('echo hi 2', depends=job1)
+            >>> self.order_jobs()
+            >>> assert self.workers is not workers1
         """
+        cache_key = self._order_jobs_key()
+        if cache_key == self._order_cache_key:
+            return
+
         import networkx as nx
         from cmd_queue.util.util_network_text import write_network_text
         graph = self._dependency_graph()
-
-        # Get rid of implicit dependencies
+        # Plain lookup tables avoid repeated NodeView indexing in the loops
+        index_of = {n: d['index'] for n, d in graph.nodes(data=True)}
+        job_of = {n: d['job'] for n, d in graph.nodes(data=True)}
+        # Jobs without a cost estimate count as one unit of work
+        cost_of = {}
+        for n, job in job_of.items():
+            cost = getattr(job, 'cost', None)
+            cost_of[n] = 1 if cost is None else cost
+
+        # Get rid of implicit dependencies. A forest has no redundant edges,
+        # so the (expensive) reduction would be the identity.
         try:
-            reduced_graph = nx.transitive_reduction(graph)
+            if len(graph) and nx.is_forest(graph):
+                reduced_graph = graph
+            else:
+                reduced_graph = nx.transitive_reduction(graph)
+                reduced_graph.add_nodes_from(graph.nodes(data=True))
         except Exception as ex:
             print('ex = {!r}'.format(ex))
             print('graph = {!r}'.format(graph))
@@ -445,28 +668,44 @@ class TMUXMultiQueue(base_queue.Queue):
                 cut_edges.extend(list(reduced_graph.out_edges(n)))
                 out_cut_nodes.add(n)
 
-        cut_graph = reduced_graph.copy()
-        cut_graph.remove_edges_from(cut_edges)
-
-        # Get all the node groups disconnected by the cuts
-        condensed = nx.condensation(reduced_graph, nx.weakly_connected_components(cut_graph))
+        # Get all the node groups disconnected by the cuts. The restricted
+        # view hides the cut edges without copying the graph.
+        cut_graph = nx.restricted_view(reduced_graph, [], cut_edges)
+        cut_groups = nx.weakly_connected_components(cut_graph)
 
         # TODO: can we use nx.topological_generations for a more ellegant
         # solution here?
 
-        # Rank each condensed group, which defines
-        # what order it is allowed to be executed in
+        # Find the cut ancestors of every node in a single topological sweep
+        # that pushes each node's cut ancestors along its out edges. The
+        # ancestor sets are int bitmasks (one bit per cut node), so each edge
+        # costs an OR instead of a set union.
+        in_cut_bit = {n: 1 << i for i, n in enumerate(in_cut_nodes)}
+        out_cut_bit = {n: 1 << i for i, n in enumerate(out_cut_nodes)}
+        cut_in_ancestors_of = dict.fromkeys(reduced_graph.nodes, 0)
+        cut_out_ancestors_of = dict.fromkeys(reduced_graph.nodes, 0)
+        for n in nx.topological_sort(reduced_graph):
+            n_cut_in = cut_in_ancestors_of[n] | in_cut_bit.get(n, 0)
+            n_cut_out = cut_out_ancestors_of[n] | out_cut_bit.get(n, 0)
+            for succ in reduced_graph.successors(n):
+                cut_in_ancestors_of[succ] |= n_cut_in
+                cut_out_ancestors_of[succ] |= n_cut_out
+
+        # Rank each group, which defines what order it is allowed to be
+        # executed in. The rank only depends on the precomputed cut ancestors,
+        # so the groups do not need to be visited in topological order.
         rankings = ub.ddict(set)
-        condensed_order = list(nx.topological_sort(condensed))
-        for c_node in condensed_order:
-            members = set(condensed.nodes[c_node]['members'])
-            ancestors = set(ub.flatten([nx.ancestors(reduced_graph, m) for m in members]))
-            cut_in_ancestors = ancestors & in_cut_nodes
-            cut_out_ancestors = ancestors & out_cut_nodes
-            cut_in_members = members & in_cut_nodes
-            rank = len(cut_in_members) + len(cut_out_ancestors) + len(cut_in_ancestors)
+        for members in cut_groups:
+            cut_in_ancestors = 0
+            cut_out_ancestors = 0
             for m in members:
-                rankings[rank].update(members)
+                cut_in_ancestors |= cut_in_ancestors_of[m]
+                cut_out_ancestors |= cut_out_ancestors_of[m]
+            cut_in_members = members & in_cut_nodes
+            rank = (len(cut_in_members) + bin(cut_out_ancestors).count('1') +
+                    bin(cut_in_ancestors).count('1'))
+            # Each node is a member of exactly one group
+            rankings[rank].update(members)
 
         if 0:
             from graphid.util import util_graphviz
@@ -474,9 +713,6 @@ class TMUXMultiQueue(base_queue.Queue):
             kwplot.autompl()
             util_graphviz.show_nx(graph, fnum=1)
             util_graphviz.show_nx(reduced_graph, fnum=3)
-            util_graphviz.show_nx(condensed, fnum=2)
-
-        # cmd_queue.write_network_text(condensed, write=print)
 
         # Each rank defines a group that must itself be ordered
         # Ranks will execute sequentially, members within the
@@ -491,23 +727,25 @@ class TMUXMultiQueue(base_queue.Queue):
                 wcc_order = list(nx.topological_sort(sub_subgraph))
                 parallel_groups.append(wcc_order)
             # Ranked bins
-            # Solve a bin packing problem to partition these into self.size groups
-            from cmd_queue.util.util_algo import balanced_number_partitioning
-            # Weighting by job heaviness would help here.
-            group_weights = list(map(len, parallel_groups))
-            groupxs = balanced_number_partitioning(group_weights, num_parts=self.size)
+            # Solve a bin packing problem to partition these into self.size
+            # groups, weighted by the total cost of each group.
+            group_weights = tuple(sum(cost_of[n] for n in group)
+                                  for group in parallel_groups)
+            if len(group_weights) <= self.size:
+                # Every group gets its own worker, no partitioning needed
+                groupxs = [[gx] for gx in range(len(group_weights))]
+            else:
+                groupxs = _partition_weights(group_weights, self.size)
             rank_groups = [list(ub.take(parallel_groups, gxs)) for gxs in groupxs]
             rank_groups = [g for g in rank_groups if len(g)]
 
             # Reorder each group to better agree with submission order
             rank_jobs = []
             for group in rank_groups:
-                priorities = []
-                for nodes in group:
-                    nodes_index = min(graph.nodes[n]['index'] for n in nodes)
-                    priorities.append(nodes_index)
-                final_queue_order = list(ub.flatten(ub.take(group, ub.argsort(priorities))))
-                final_queue_jobs = [graph.nodes[n]['job'] for n in final_queue_order]
+                sorted_group = sorted(group, key=lambda nodes: min(
+                    index_of[n] for n in nodes))
+                final_queue_jobs = [job_of[n]
+                                    for n in it.chain.from_iterable(sorted_group)]
                 rank_jobs.append(final_queue_jobs)
             ranked_job_groups.append(rank_jobs)
 
@@ -516,85 +754,107 @@ class TMUXMultiQueue(base_queue.Queue):
             # split up the ranks, which means we dont need semaphores.
             serial_groups = []
             for rank_jobs in ranked_job_groups:
-                serial_groups.extend(list(ub.flatten(rank_jobs)))
+                serial_groups.extend(it.chain.from_iterable(rank_jobs))
             ranked_job_groups = [[serial_groups]]
 
-        queue_workers = []
-        flag_dpath = (self.dpath / 'semaphores')
-        prev_rank_flag_fpaths = None
-        for rank, rank_jobs in enumerate(ranked_job_groups):
-            # Hack, abuse init workers each time to construct workers
-            workers = self._new_workers(start=len(queue_workers))
-            rank_workers = []
+        # Each slot keeps a single worker for the entire run. The jobs for
+        # each rank are appended to it. Dependencies within a rank always run
+        # earlier on the same worker, so a job only has to wait for the
+        # dependencies that ran on a different worker in an earlier rank.
+        # Every job writes its pass or fail file when it stops (even if it was
+        # skipped), so those files are the flags we wait on. This lets a chain
+        # start as soon as its own dependencies finish instead of waiting for
+        # the entire previous rank.
+        workers = self._new_workers()
+        worker_of = {}
+        for rank_jobs in ranked_job_groups:
             for worker, jobs in zip(workers, rank_jobs):
-                # Add a dummy job to wait for dependencies of this linear queue
-
-                if prev_rank_flag_fpaths:
-                    command = self._semaphore_wait_command(prev_rank_flag_fpaths, msg=f"wait for previous rank {rank - 1}")
-                    # Note: this should not be a real job
-                    worker.submit(command, bookkeeper=1)
-
                 for job in jobs:
-                    # worker.submit(job.command)
+                    other_deps = []
+                    for dep in job.depends or []:
+                        dep_worker = None if dep is None else worker_of.get(dep.name, None)
+                        if dep_worker is not None and dep_worker is not worker:
+                            other_deps.append(dep)
+                    if other_deps:
+                        # Add a dummy job to wait for the other workers
+                        flag_fpaths = [(dep.pass_fpath, dep.fail_fpath)
+                                       for dep in other_deps]
+                        command = self._semaphore_wait_command(
+                            flag_fpaths, msg=f'wait for {len(other_deps)} dependencies')
+                        # Note: this should not be a real job
+                        worker.submit(command, bookkeeper=1,
+                                      name=f'{worker.name}-wait-{job.name}')
                     worker.submit(job)
+                    worker_of[job.name] = worker
 
-                rank_workers.append(worker)
-
-            queue_workers.extend(rank_workers)
-
-            # Add a dummy job at the end of each worker to signal finished
-            rank_flag_fpaths = []
-            num_rank_workers = len(rank_workers)
-            for worker_idx, worker in enumerate(rank_workers):
-                rank_flag_fpath = flag_dpath / f'rank_flag_{rank}_{worker_idx}_{num_rank_workers}.done'
-                command = self._semaphore_signal_command(rank_flag_fpath)
-                # Note: this should not be a real job
-                worker.submit(command, bookkeeper=1)
-                rank_flag_fpaths.append(rank_flag_fpath)
-            prev_rank_flag_fpaths = rank_flag_fpaths
+        # Slots that never received a job do not need a session
+        queue_workers = [worker for worker in workers if len(worker)]
 
         # Overwrite workers with our new dependency aware workers
         for worker in queue_workers:
             for header_command in self.header_commands:
                 worker.add_header_command(header_command)
         self.workers = queue_workers
+        self._order_cache_key = cache_key
 
     def add_header_command(self, command):
         """
         Adds a header command run at the start of each queue
         """
+        self._order_cache_key = None
         self.header_commands.append(command)
 
     def finalize_text(self, **kwargs):
+        driver_text = '\n\n'.join(self._iter_driver_parts())
+        return driver_text
+
+    def _iter_text_chunks(self, **kwargs):
+        # Stream the driver script parts rather than joining them
+        for idx, part in enumerate(self._iter_driver_parts()):
+            if idx > 0:
+                yield '\n\n'
+            yield part
+
+    def _iter_driver_parts(self):
+        """
+        Generate the blocks of the driver script that starts the workers.
+        """
         self.order_jobs()
         # Create a driver script
-        driver_lines = [ub.codeblock(
-            f'''
-            #!/bin/bash
-            # Driver script to start the tmux-queue
-            echo "Submitting {self.num_real_jobs} jobs to a tmux queue"
-            ''')]
-        for queue in self.workers:
-            # run_command_in_tmux_queue(command, name)
+        yield _DRIVER_HEADER_TEMPLATE.format(num_jobs=self.num_real_jobs)
+        if self.workers:
             # TODO: figure out how to forward environment variables from the
             # running sessions. We dont want to log secrets to plaintext.
-            part = ub.codeblock(
-                f'''
-                ### Run Queue: {queue.pathid} with {len(queue)} jobs
-                tmux new-session -d -s {queue.pathid} "bash"
-                tmux send -t {queue.pathid} \\
-                    "source {queue.fpath}" \\
-                    Enter
-                ''').format()
-            driver_lines.append(part)
-        driver_lines += [f'echo "Spread jobs across {len(self.workers)} tmux workers"']
-        driver_text = '\n\n'.join(driver_lines)
-        return driver_text
+            comments = [
+                _RUN_WORKER_COMMENT_TEMPLATE.format(
+                    pathid=queue.pathid, num_jobs=len(queue))
+                for queue in self.workers]
+            chain = ' \\; \\\n'.join(
+                _RUN_WORKER_TEMPLATE.format(
+                    pathid=queue.pathid, fpath=queue.fpath)
+                for queue in self.workers)
+            yield '\n'.join(comments) + '\ntmux \\\n' + ub.indent(chain)
+        yield f'echo "Spread jobs across {len(self.workers)} tmux workers"'
+
+    def _write_workers(self):
+        """
+        Write the script for each worker, using a thread pool if there are
+        several of them.
 
-    def write(self):
+        Returns:
+            List[ub.Path]: the paths of the written worker scripts
+        """
         self.order_jobs()
-        for queue in self.workers:
-            queue.write()
+        if len(self.workers) <= 1:
+            return [queue.write() for queue in self.workers]
+        max_workers = min(16, len(self.workers))
+        with ub.Executor(mode='thread', max_workers=max_workers) as executor:
+            futures = [executor.submit(queue.write) for queue in self.workers]
+            queue_fpaths = [future.result() for future in futures]
+        return queue_fpaths
+
+    def write(self):
+        self._write_workers()
         super().write()
 
     def kill_other_queues(self, ask_first=True):
@@ -602,28 +862,26 @@ class TMUXMultiQueue(base_queue.Queue):
         Find other tmux sessions that look like they were started with
         cmd_queue and kill them.
         """
-        import parse
-        queue_name_pattern = parse.Parser(self._tmux_session_prefix + '{name}_{rootid}')
+        # Worker sessions are named {prefix}{name}_{worker_idx}_{rootid}.
+        # Matching the escaped name exactly also handles names that contain
+        # underscores.
+        session_pattern = re.compile(
+            re.escape(self._tmux_session_prefix + self.name) + r'_\d+_')
         current_sessions = self._tmux_current_sessions()
-        other_session_ids = []
-        for info in current_sessions:
-            matched = queue_name_pattern.parse(info['id'])
-            if matched is not None:
-                if self.name == matched['name']:
-                    other_session_ids.append(info['id'])
+        other_session_ids = [info['id'] for info in current_sessions
+                             if session_pattern.match(info['id'])]
         # print(f'other_session_ids={other_session_ids}')
         if other_session_ids:
             print(f'Detected {len(other_session_ids)} other running cmd-queue sessions with the same name')
             print('Commands to kill them:')
             kill_commands = []
             for sess_id in other_session_ids:
-                command2 = f'tmux kill-session -t {sess_id}'
+                command2 = tmux._kill_session_command(sess_id)
                 print(command2)
                 kill_commands.append(command2)
-            from rich import prompt
-            if not ask_first or prompt.Confirm().ask('Do you want to kill the other sessions?'):
-                for command in kill_commands:
-                    ub.cmd(command, verbose=self.cmd_verbose)
+            from rich.prompt import Confirm
+            if not ask_first or Confirm().ask('Do you want to kill the other sessions?'):
+                self._run_tmux_commands(kill_commands)
 
     def handle_other_sessions(self, other_session_handler):
         if other_session_handler == 'auto':
@@ -672,6 +930,11 @@ class TMUXMultiQueue(base_queue.Queue):
                 self.kill_other_queues(ask_first=True)
 
         self.write()
+        # Starting the workers changes the set of running sessions, and the
+        # state of workers that finished in a previous run
+        self._sessions_cache = None
+        self._frozen_workers = None
+        # The driver script starts every worker with one chained tmux call
         ub.cmd(f'bash {self.fpath}', verbose=self.cmd_verbose, check=True,
                system=system)
         if block:
@@ -685,10 +948,7 @@ class TMUXMultiQueue(base_queue.Queue):
 
     def read_state(self):
         agg_state = {}
-        worker_states = []
-        for worker in self.workers:
-            state = worker.read_state()
-            worker_states.append(state)
+        worker_states = self._read_worker_states()
         agg_state['worker_states'] = worker_states
         try:
             agg_state['total'] = sum(s['total'] for s in worker_states)
@@ -710,11 +970,7 @@ class TMUXMultiQueue(base_queue.Queue):
         See Serial Queue instead
         """
         # deprecate: use serial queue instead
-        self.order_jobs()
-        queue_fpaths = []
-        for queue in self.workers:
-            fpath = queue.write()
-            queue_fpaths.append(fpath)
+        queue_fpaths = self._write_workers()
         for fpath in queue_fpaths:
             ub.cmd(f'{fpath}', verbose=self.cmd_verbose, check=True)
 
@@ -766,21 +1022,32 @@ class TMUXMultiQueue(base_queue.Queue):
         """
         # print('Start monitor')
         if with_textual == 'auto':
-            with_textual = CmdQueueMonitorApp is not None
+            with_textual = _find_monitor_app() is not None
             # If we dont have stdin (i.e. running in pytest) we cant use
             # textual.
             if not has_stdin():
                 with_textual = False
 
-        if with_textual:
-            self._textual_monitor()
-        else:
-            self._simple_rich_monitor(refresh_rate)
-        table, finished, agg_state = self._build_status_table()
+        # One pool reads the worker states for the whole monitor loop
+        read_pool = None
+        if len(self.workers) >= _MIN_POOL_READ_WORKERS:
+            read_pool = ub.Executor(mode='thread',
+                                    max_workers=min(32, len(self.workers)))
+        try:
+            if with_textual:
+                self._textual_monitor(read_pool=read_pool)
+            else:
+                self._simple_rich_monitor(refresh_rate, read_pool=read_pool)
+            table, finished, agg_state = self._build_status_table(
+                max_age=0, read_pool=read_pool)
+        finally:
+            if read_pool is not None:
+                read_pool.shutdown()
         return agg_state
 
-    def _textual_monitor(self):
+    def _textual_monitor(self, read_pool=None):
         from rich import print as rich_print
+        from rich.prompt import Confirm
 
         if 0:
             print('Kill commands:')
@@ -789,106 +1056,364 @@ class TMUXMultiQueue(base_queue.Queue):
 
         is_running = True
         while is_running:
-            table_fn = self._build_status_table
-            app = CmdQueueMonitorApp(table_fn, kill_fn=self.kill)
+            table_fn = functools.partial(self._build_status_table,
+                                         read_pool=read_pool)
+            app = _find_monitor_app()(table_fn, kill_fn=self.kill)
             app.run()
 
-            table, finished, agg_state = self._build_status_table()
+            table, finished, agg_state = table_fn(max_age=0)
             rich_print(table)
 
             if app.graceful_exit:
                 is_running = False
             else:
-                from rich.prompt import Confirm
                 flag = Confirm.ask('do you to kill the procs?')
                 if flag:
                     self.kill()
                     is_running = False
 
-    def _simple_rich_monitor(self, refresh_rate=0.4):
-        import time
+    def _simple_rich_monitor(self, refresh_rate=0.4, read_pool=None):
         from rich.live import Live
+        from rich.prompt import Confirm
         if 0:
             print('Kill commands:')
             for command in self._kill_commands():
                 print(command)
+        watcher = self._new_state_watcher()
         try:
-            table, finished, agg_state = self._build_status_table()
+            table, changed, finished, agg_state = self._update_status_table(
+                read_pool=read_pool)
+            # Without a watcher, poll less often while nothing is changing
+            sleep_time = refresh_rate
+            max_sleep_time = max(refresh_rate, 4.0)
             with Live(table, refresh_per_second=4) as live:
                 while not finished:
-                    time.sleep(refresh_rate)
-                    table, finished, agg_state = self._build_status_table()
-                    live.update(table)
+                    if watcher is None:
+                        time.sleep(sleep_time)
+                        max_age = 0.25
+                    else:
+                        # Sleep until a worker writes its state (coalescing
+                        # bursts of writes), with a slow poll as a fallback.
+                        watcher.read(timeout=int(max(refresh_rate, 5) * 1000),
+                                     read_delay=50)
+                        max_age = 0
+                    table, changed, finished, agg_state = self._update_status_table(
+                        max_age=max_age, read_pool=read_pool)
+                    if changed:
+                        # Hand Live a new table instead of editing the one it
+                        # is rendering, and only redraw when a cell changed
+                        live.update(table, refresh=True)
+                        sleep_time = refresh_rate
+                    else:
+                        sleep_time = min(sleep_time * 1.5, max_sleep_time)
         except KeyboardInterrupt:
-            from rich.prompt import Confirm
             flag = Confirm.ask('do you to kill the procs?')
             if flag:
                 self.kill()
+        finally:
+            if watcher is not None:
+                watcher.close()
 
-    def _build_status_table(self):
-        from rich.table import Table
-        # https://rich.readthedocs.io/en/stable/live.html
-        table = Table()
-        columns = ['tmux session name', 'status', 'passed', 'failed', 'skipped', 'total']
-        for col in columns:
-            table.add_column(col)
+    def _new_state_watcher(self):
+        """
+        Create an inotify watch on the directories of the worker state files.
+
+        Returns:
+            inotify_simple.INotify | None:
+                None if inotify_simple is not installed or the watch fails
+        """
+        if inotify_simple is None:
+            return None
+        flags = inotify_simple.flags
+        mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE
+        watcher = inotify_simple.INotify()
+        try:
+            for dpath in ub.unique(w.state_fpath.parent for w in self.workers):
+                watcher.add_watch(dpath, mask)
+        except OSError:
+            watcher.close()
+            return None
+        return watcher
+
+    def _scan_worker_state_stats(self, workers=None):
+        """
+        Stat all worker state files with one directory scan per directory.
+
+        Only the state files are stat-ed, the worker scripts and other
+        entries that share the directory are skipped.
+
+        Args:
+            workers (List[SerialQueue] | None):
+                the workers to stat, defaults to all of them
+
+        Returns:
+            Dict[str, os.stat_result]: maps state file paths to their stat
+        """
+        if workers is None:
+            workers = self.workers
+        state_stats = {}
+        state_fpaths = {str(w.state_fpath) for w in workers}
+        state_dpaths = ub.unique(w.state_fpath.parent for w in workers)
+        for dpath in state_dpaths:
+            try:
+                with os.scandir(dpath) as entries:
+                    for entry in entries:
+                        if entry.path in state_fpaths:
+                            state_stats[entry.path] = entry.stat()
+            except FileNotFoundError:
+                pass
+        return state_stats
+
+    def _read_worker_states(self, read_pool=None):
+        """
+        Read the state of every worker.
+
+        The reads are I/O bound, so if a ``read_pool`` is given (the monitor
+        owns one) and there are many workers to read, they run on it. This
+        hides the per-file latency on slow (e.g. network) filesystems.
+
+        A worker is frozen once it reports the same (cached) finished state
+        twice in a row. Its state file is then neither scanned nor read again
+        until the workers change or the queue is run again.
+
+        Args:
+            read_pool (ub.Executor | None): threads to read the states on
+
+        Returns:
+            List[Dict]: the state of each worker in ``self.workers``
+
+        Example:
+            >>> from cmd_queue.tmux_queue import *  # NOQA
+            >>> import json, os
+            >>> self = TMUXMultiQueue(1, 'test-frozen-states')
+            >>> self.submit('echo hi')
+            >>> self.order_jobs()
+            >>> worker = self.workers[0]
+            >>> worker.state_fpath.parent.ensuredir()
+            >>> worker.state_fpath.write_text(json.dumps({
+            >>>     'name': worker.name, 'status': 'done', 'passed': 1,
+            >>>     'failed': 0, 'skipped': 0, 'total': 1}))
+            >>> # Backdate the file so read_state trusts its cache
+            >>> os.utime(worker.state_fpath, (0, 0))
+            >>> state1, = self._read_worker_states()
+            >>> state2, = self._read_worker_states()
+            >>> assert worker.pathid in self._frozen_states
+            >>> worker.state_fpath.unlink()
+            >>> state3, = self._read_worker_states()
+            >>> assert state3 is state1
+        """
+        if self._frozen_workers is not self.workers:
+            self._frozen_workers = self.workers
+            self._frozen_states = {}
+            self._last_worker_states = {}
+        frozen_states = self._frozen_states
+        last_states = self._last_worker_states
+        active_workers = [worker for worker in self.workers
+                          if worker.pathid not in frozen_states]
+
+        state_stats = self._scan_worker_state_stats(active_workers)
+
+        def _read(worker):
+            prefetched_stat = state_stats.get(str(worker.state_fpath), None)
+            return worker.read_state(prefetched_stat=prefetched_stat)
+
+        if read_pool is None or len(active_workers) < _MIN_POOL_READ_WORKERS:
+            active_states = [_read(worker) for worker in active_workers]
+        else:
+            active_states = list(read_pool.map(_read, active_workers))
+
+        for worker, state in zip(active_workers, active_states):
+            # read_state returns the same object while the file is unchanged
+            if state['status'] == 'done' and last_states.get(worker.pathid) is state:
+                frozen_states[worker.pathid] = state
+            last_states[worker.pathid] = state
+        return [last_states[worker.pathid] for worker in self.workers]
+
+    def _build_status_rows(self, max_age=0.25, read_pool=None):
+        """
+        Read the state of each worker and format it as table rows.
+
+        Building the rows is separate from building the rich table so callers
+        can skip re-rendering when nothing has changed.
+
+        Args:
+            max_age (float):
+                A result computed less than this many seconds ago is returned
+                without touching the disk. This lets UIs that re-render often
+                (e.g. the textual monitor) share one scan of the state files.
+                Set to 0 to always re-read.
+
+            read_pool (ub.Executor | None):
+                see :func:`_read_worker_states`
+
+        Returns:
+            Tuple[List[Tuple[Tuple[str, str], ...]], bool, Dict]:
+                the rows of (text, style) cells, if all workers are finished,
+                and the aggregate state
+
+        Example:
+            >>> from cmd_queue.tmux_queue import *  # NOQA
+            >>> self = TMUXMultiQueue(1, 'test-status-rows')
+            >>> job = self.submit('echo hi')
+            >>> self.order_jobs()
+            >>> result1 = self._build_status_rows(max_age=60)
+            >>> assert self._build_status_rows(max_age=60) is result1
+            >>> assert self._build_status_rows(max_age=0) is not result1
+        """
+        now = time.monotonic()
+        if self._status_cache is not None:
+            cached_time, cached_result = self._status_cache
+            if now - cached_time < max_age:
+                return cached_result
+
+        if self._agg_workers is not self.workers:
+            # The workers were rebuilt, start the accumulators over
+            self._agg_workers = self.workers
+            self._agg_counts = [0, 0, 0, 0]
+            self._worker_status = {}
+        agg_counts = self._agg_counts
+        worker_status = self._worker_status
 
         finished = True
+        rows = []
+        states = self._read_worker_states(read_pool=read_pool)
+        for worker, state in zip(self.workers, states):
+            prev = worker_status.get(worker.pathid, None)
+            if prev is not None and prev[0] is state:
+                # read_state returned its cached state, nothing changed
+                _, row, counts = prev
+            else:
+                row, counts = self._worker_status_row(state)
+                # Update the aggregate with the difference from the last state
+                prev_counts = (0, 0, 0, 0) if prev is None else prev[2]
+                for idx, (new, old) in enumerate(zip(counts, prev_counts)):
+                    agg_counts[idx] += new - old
+                worker_status[worker.pathid] = (state, row, counts)
+            if state['status'] != 'done':
+                finished = False
+            rows.append(row)
+
         agg_state = {
             'name': 'agg',
             'status': '',
-            'failed': 0,
-            'passed': 0,
-            'skipped': 0,
-            'total': 0
+            'failed': agg_counts[1],
+            'passed': agg_counts[0],
+            'skipped': agg_counts[2],
+            'total': agg_counts[3],
         }
 
-        for worker in self.workers:
-            pass_color = ''
-            fail_color = ''
-            skip_color = ''
-            state = worker.read_state()
-            if state['status'] == 'unknown':
-                finished = False
-                pass_color = '[yellow]'
-            else:
-                finished &= (state['status'] == 'done')
-                if state['status'] == 'done':
-                    pass_color = '[green]'
-
-                if (state['failed'] > 0):
-                    fail_color = '[red]'
-                if (state['skipped'] > 0):
-                    skip_color = '[yellow]'
-
-                agg_state['total'] += state['total']
-                agg_state['passed'] += state['passed']
-                agg_state['failed'] += state['failed']
-                agg_state['skipped'] += state['skipped']
-
-            table.add_row(
-                state['name'],
-                state['status'],
-                f"{pass_color}{state['passed']}",
-                f"{fail_color}{state['failed']}",
-                f"{skip_color}{state['skipped']}",
-                f"{state['total']}",
-            )
-
         if not finished:
             agg_state['status'] = 'run'
         else:
             agg_state['status'] = 'done'
 
         if len(self.workers) > 1:
-            table.add_row(
-                agg_state['name'],
-                agg_state['status'],
-                f"{agg_state['passed']}",
-                f"{agg_state['failed']}",
-                f"{agg_state['skipped']}",
-                f"{agg_state['total']}",
-            )
+            rows.append((
+                (agg_state['name'], ''),
+                (agg_state['status'], ''),
+                (f"{agg_state['passed']}", ''),
+                (f"{agg_state['failed']}", ''),
+                (f"{agg_state['skipped']}", ''),
+                (f"{agg_state['total']}", ''),
+            ))
+        result = (rows, finished, agg_state)
+        self._status_cache = (now, result)
+        return result
+
+    @staticmethod
+    def _worker_status_row(state):
+        """
+        Format the status table row for one worker state.
+
+        Returns:
+            Tuple[Tuple[Tuple[str, str], ...], Tuple[int, int, int, int]]:
+                the row and the (passed, failed, skipped, total) counts that
+                the worker contributes to the aggregate.
+        """
+        status = state['status']
+        pass_style = _STATUS_PASS_STYLES.get(status, '')
+        if status == 'unknown':
+            fail_style = skip_style = ''
+            counts = (0, 0, 0, 0)
+        else:
+            fail_style = 'red' if state['failed'] > 0 else ''
+            skip_style = 'yellow' if state['skipped'] > 0 else ''
+            counts = (state['passed'], state['failed'], state['skipped'],
+                      state['total'])
+        row = (
+            (state['name'], ''),
+            (state['status'], ''),
+            (f"{state['passed']}", pass_style),
+            (f"{state['failed']}", fail_style),
+            (f"{state['skipped']}", skip_style),
+            (f"{state['total']}", ''),
+        )
+        return row, counts
+
+    @staticmethod
+    def _status_table_from_rows(rows):
+        # https://rich.readthedocs.io/en/stable/live.html
+        from rich.table import Table
+        from rich.text import Text
+        table = Table()
+        columns = ['tmux session name', 'status', 'passed', 'failed', 'skipped', 'total']
+        for col in columns:
+            table.add_column(col)
+        add_row = table.add_row
+        for row in rows:
+            add_row(*[Text(value, style=style) for value, style in row])
+        return table
+
+    def _update_status_table(self, max_age=0.25, read_pool=None):
+        """
+        Get the rich status table, rebuilding it only when a row changed.
+
+        A table that was handed out is never modified, because ``Live``
+        renders it from its own refresh thread.
+
+        Returns:
+            Tuple[Table, bool, bool, Dict]:
+                the table, if any cell changed, if all workers are finished,
+                and the aggregate state
+        """
+        rows, finished, agg_state = self._build_status_rows(
+            max_age=max_age, read_pool=read_pool)
+        if self._status_table_cache is not None:
+            cached_rows, table = self._status_table_cache
+            if cached_rows == rows:
+                return table, False, finished, agg_state
+        table = self._status_table_from_rows(rows)
+        self._status_table_cache = (rows, table)
+        return table, True, finished, agg_state
+
+    def _build_status_table(self, max_age=0.25, read_pool=None):
+        """
+        Get the rich status table, which is only rebuilt when the worker
+        states change.
+
+        Example:
+            >>> from cmd_queue.tmux_queue import *  # NOQA
+            >>> self = TMUXMultiQueue(1, 'test-status-table')
+            >>> job = self.submit('echo hi')
+            >>> self.order_jobs()
+            >>> table1, finished, agg_state = self._build_status_table(max_age=0)
+            >>> self.workers[0].state_fpath.write_text(
+            >>>     '{"name": "w", "status": "run", "passed": 1, "failed": 0, '
+            >>>     '"skipped": 0, "total": 1}')
+            >>> table2, finished, agg_state = self._build_status_table(max_age=0)
+            >>> assert table1 is not table2
+            >>> table3, finished, agg_state = self._build_status_table(max_age=0)
+            >>> assert table2 is table3
+            >>> assert agg_state['passed'] == 1
+            >>> # xdoctest: +REQUIRES(module:rich)
+            >>> from rich.console import Console
+            >>> console = Console(width=80, color_system=None)
+            >>> with console.capture() as capture:
+            >>>     console.print(table2)
+            >>> assert '│ run ' in capture.get()
+        """
+        table, changed, finished, agg_state = self._update_status_table(
+            max_age=max_age, read_pool=read_pool)
         return table, finished, agg_state
 
     def print_commands(self, *args, **kwargs):
@@ -944,11 +1469,28 @@ class TMUXMultiQueue(base_queue.Queue):
             queue.print_commands(*args, **kwargs)
         super().print_commands(*args, **kwargs)
 
-    def current_output(self):
-        for queue in self.workers:
-            print('\n\nqueue = {!r}'.format(queue))
-            # First print out the contents for debug
-            tmux.capture_pane(target_session=queue.pathid, verbose=self.cmd_verbose)
+    def current_output(self, batched=True):
+        """
+        Print the current contents of each worker's tmux pane.
+
+        Args:
+            batched (bool): if True, capture every pane from a single shell
+                invocation instead of running one tmux process per worker.
+        """
+        if not batched:
+            for queue in self.workers:
+                print('\n\nqueue = {!r}'.format(queue))
+                # First print out the contents for debug
+                tmux.capture_pane(target_session=queue.pathid, verbose=self.cmd_verbose)
+            return
+        if not self.workers:
+            return
+        script = ''.join(
+            'printf "\\n\\nqueue = %s\\n" {}; {}; '.format(
+                shlex.quote(repr(queue)),
+                tmux._capture_pane_command(target_session=queue.pathid))
+            for queue in self.workers)
+        ub.cmd(['bash', '-c', script], verbose=self.cmd_verbose)
 
     def _print_commands(self):
         # First print out the contents for debug
@@ -961,17 +1503,44 @@ class TMUXMultiQueue(base_queue.Queue):
             command2 = tmux._kill_session_command(target_session=queue.pathid)
             yield command2
 
+    def _run_tmux_commands(self, commands):
+        """
+        Run multiple tmux commands with a single tmux invocation.
+
+        If the chained call fails (e.g. one of the sessions no longer exists,
+        which makes tmux stop early) then run them one at a time.
+        """
+        commands = list(commands)
+        if not commands:
+            return
+        self._sessions_cache = None
+        info = ub.cmd(tmux._chain_commands(commands), verbose=self.cmd_verbose)
+        if info['ret'] != 0 and len(commands) > 1:
+            for command in commands:
+                ub.cmd(command, verbose=self.cmd_verbose)
+
     def capture(self):
-        for command in self._print_commands():
-            ub.cmd(command, verbose=self.cmd_verbose)
+        self._run_tmux_commands(self._print_commands())
 
     def kill(self):
         # Kills all the tmux panes
-        for command in self._kill_commands():
-            ub.cmd(command, verbose=self.cmd_verbose)
+        self._run_tmux_commands(self._kill_commands())
+
+    def _tmux_current_sessions(self, max_age=0.5):
+        """
+        List the running tmux sessions.
 
-    def _tmux_current_sessions(self):
+        The result is reused for ``max_age`` seconds so repeated checks do not
+        each start a new tmux process. Starting or killing sessions through
+        this queue clears the cache.
+        """
+        now = time.monotonic()
+        if self._sessions_cache is not None:
+            cached_time, sessions = self._sessions_cache
+            if now - cached_time < max_age:
+                return sessions
         sessions = tmux.list_sessions()
+        self._sessions_cache = (now, sessions)
         return sessions
 
 
@@ -985,13 +1554,23 @@ def has_stdin():
         return True
 
 
-try:
-    import textual  # NOQA
-    from cmd_queue.monitor_app import CmdQueueMonitorApp
-    if not hasattr(CmdQueueMonitorApp, 'run'):
-        raise ImportError('Current textual monitor is broken on new versions')
-except ImportError:
-    CmdQueueMonitorApp = None
+@cache
+def _find_monitor_app():
+    """
+    Import the textual monitor on first use.
+
+    Returns:
+        type | None: the CmdQueueMonitorApp class or None if textual is
+            unavailable or incompatible.
+    """
+    try:
+        import textual  # NOQA
+        from cmd_queue.monitor_app import CmdQueueMonitorApp
+        if not hasattr(CmdQueueMonitorApp, 'run'):
+            raise ImportError('Current textual monitor is broken on new versions')
+    except ImportError:
+        CmdQueueMonitorApp = None
+    return CmdQueueMonitorApp
 
 
 if 0:
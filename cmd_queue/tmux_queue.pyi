@@ -11,6 +11,7 @@ class TMUXMultiQueue(base_queue.Queue):
     environ: Incomplete
     fpath: Incomplete
     gpus: Incomplete
+    split_gpus: bool
     cmd_verbose: int
     jobs: Incomplete
     header_commands: Incomplete
@@ -23,7 +24,8 @@ class TMUXMultiQueue(base_queue.Queue):
                  rootid: Incomplete | None = ...,
                  environ: Incomplete | None = ...,
                  gpus: Incomplete | None = ...,
-                 gres: Incomplete | None = ...) -> None:
+                 gres: Incomplete | None = ...,
+                 split_gpus: bool = ...) -> None:
         ...
 
     @classmethod
@@ -33,6 +35,9 @@ class TMUXMultiQueue(base_queue.Queue):
     def __nice__(self):
         ...
 
+    def submit(self, command, **kwargs):
+        ...
+
     workers: Incomplete
 
     def order_jobs(self) -> None:
@@ -76,7 +81,7 @@ class TMUXMultiQueue(base_queue.Queue):
     def print_commands(self, *args, **kwargs) -> None:
         ...
 
-    def current_output(self) -> None:
+    def current_output(self, batched: bool = True) -> None:
         ...
 
     def capture(self) -> None:
@@ -1,4 +1,4 @@
-import numpy as np
+import heapq
 
 
 def balanced_number_partitioning(items, num_parts):
@@ -25,26 +25,53 @@ def balanced_number_partitioning(items, num_parts):
 
     Example:
         >>> from cmd_queue.util.util_algo import balanced_number_partitioning
+        >>> import numpy as np
         >>> items = np.array([1, 3, 29, 22, 4, 5, 9])
         >>> num_parts = 3
         >>> bin_assignments = balanced_number_partitioning(items, num_parts)
+        >>> print([p.tolist() for p in bin_assignments])
+        [[2], [3], [6, 5, 4, 1, 0]]
         >>> # xdoctest: +REQUIRES(module:kwarray)
         >>> import kwarray
         >>> groups = kwarray.apply_grouping(items, bin_assignments)
         >>> bin_weights = [g.sum() for g in groups]
     """
+    # Deferred so importing cmd_queue does not pay for numpy
+    import numpy as np
     item_weights = np.asanyarray(items)
-    sortx = np.argsort(item_weights)[::-1]
+    sortx = np.argsort(item_weights)[::-1].tolist()
+    item_weights = item_weights.tolist()
+    ordered_weights = [item_weights[item_index] for item_index in sortx]
+    bin_assignments = [
+        np.array([sortx[pos] for pos in positions], dtype=int)
+        for positions in _greedy_partition_ordered(ordered_weights, num_parts)
+    ]
+    return bin_assignments
+
+
+def _greedy_partition_ordered(ordered_weights, num_parts):
+    """
+    Assign each weight, in the given order, to the currently smallest bin.
+
+    Args:
+        ordered_weights (List[float]): weights in the order they are assigned
+        num_parts (int): number of partitions
+
+    Returns:
+        List[List[int]]: positions in ``ordered_weights`` assigned to each bin
 
+    Example:
+        >>> from cmd_queue.util.util_algo import _greedy_partition_ordered
+        >>> _greedy_partition_ordered([29, 22, 9, 5, 4, 3, 1], 3)
+        [[0], [1], [2, 3, 4, 5, 6]]
+    """
     bin_assignments = [[] for _ in range(num_parts)]
-    bin_sums = np.zeros(num_parts)
+    # Heap of (bin_sum, bin_index) so the smallest bin is found in log time
+    bin_heap = [(0, bin_index) for bin_index in range(num_parts)]
 
-    for item_index in sortx:
+    for pos, item_weight in enumerate(ordered_weights):
         # Assign item to the smallest bin
-        item_weight = item_weights[item_index]
-        bin_index = bin_sums.argmin()
-        bin_assignments[bin_index].append(item_index)
-        bin_sums[bin_index] += item_weight
-
-    bin_assignments = [np.array(p, dtype=int) for p in bin_assignments]
+        bin_sum, bin_index = heapq.heappop(bin_heap)
+        bin_assignments[bin_index].append(pos)
+        heapq.heappush(bin_heap, (bin_sum + item_weight, bin_index))
     return bin_assignments
@@ -613,7 +613,11 @@ def _find_sources(graph):
     """
     # For each connected part of the graph, choose at least
     # one node as a starting point, preferably without a parent
-    if graph.is_directed():
+    if graph.is_directed() and nx.is_directed_acyclic_graph(graph):
+        # In a DAG every SCC is a single node (the common case for job
+        # graphs), so the sources are simply the nodes without parents.
+        sources = [n for n in graph.nodes if graph.in_degree[n] == 0]
+    elif graph.is_directed():
         # Choose one node from each SCC with minimum in_degree
         sccs = list(nx.strongly_connected_components(graph))
         # condensing the SCCs forms a dag, the nodes in this graph with
@@ -1,6 +1,7 @@
 """
 Generic tmux helpers
 """
+import subprocess
 import ubelt as ub
 
 
@@ -8,16 +9,19 @@ class tmux:
 
     @staticmethod
     def list_sessions():
-        info = ub.cmd('tmux list-sessions')
+        # Parse the lines as tmux writes them instead of buffering the output
         sessions = []
-        for line in info['out'].split('\n'):
-            line = line.strip()
-            if line:
-                session_id, rest = line.split(':', 1)
-                sessions.append({
-                    'id': session_id,
-                    'rest': rest
-                })
+        with subprocess.Popen(['tmux', 'list-sessions'],
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True) as proc:
+            for line in proc.stdout:
+                line = line.strip()
+                if line:
+                    session_id, _, rest = line.partition(':')
+                    sessions.append({
+                        'id': session_id,
+                        'rest': rest
+                    })
         return sessions
 
     @staticmethod
@@ -29,6 +33,25 @@ class tmux:
         # Relly should take a target pane argument
         return f'tmux capture-pane -p -t "{target_session}:0.0"'
 
+    @staticmethod
+    def _chain_commands(commands):
+        r"""
+        Join multiple tmux commands so they run in a single tmux invocation.
+
+        Note:
+            tmux stops executing the chain at the first command that fails.
+
+        Example:
+            >>> from cmd_queue.util.util_tmux import tmux
+            >>> commands = [tmux._kill_session_command(s) for s in ['a', 'b']]
+            >>> print(tmux._chain_commands(commands))
+            tmux kill-session -t a \; kill-session -t b
+        """
+        prefix = 'tmux '
+        parts = [c[len(prefix):] if c.startswith(prefix) else c
+                 for c in commands]
+        return prefix + ' \\; '.join(parts)
+
     @staticmethod
     def capture_pane(target_session, verbose=3):
         return ub.cmd(tmux._capture_pane_command(target_session), verbose=verbose)
@@ -0,0 +1,108 @@
+def test_run_empty_queue():
+    import pytest
+    import cmd_queue
+    queue = cmd_queue.Queue.create(backend='tmux', name='test_run_empty_queue')
+    if not queue.is_available():
+        pytest.skip('Skip tmux test. Tmux is not available')
+    # Starting an empty queue should not start (or attach to) a tmux session
+    queue.run(block=False, other_session_handler='ignore')
+    assert queue.num_real_jobs == 0
+
+
+def test_cross_worker_job_waits():
+    """
+    A job only waits on the flag files of dependencies that ran on another
+    worker, and is skipped if one of them failed.
+    """
+    import pytest
+    import cmd_queue
+    queue = cmd_queue.Queue.create(backend='tmux', size=2,
+                                   name='test_cross_worker_job_waits')
+    job_a = queue.submit('true', name='a')
+    job_b = queue.submit('false', name='b')
+    job_d = queue.submit('true', name='d')
+    job_c = queue.submit('echo c', name='c', depends=[job_a, job_b])
+    queue.order_jobs()
+
+    worker_of = {job.name: worker for worker in queue.workers
+                 for job in worker.jobs}
+    assert worker_of['c'] is worker_of['a']
+    assert worker_of['c'] is not worker_of['b']
+
+    # The wait before "c" only involves the flags of "b"
+    text = worker_of['c'].finalize_text()
+    wait_lines = [line for line in text.split('\n')
+                  if line.startswith('while ')]
+    assert len(wait_lines) == 1
+    wait_line = wait_lines[0]
+    assert str(job_b.pass_fpath) in wait_line
+    assert str(job_b.fail_fpath) in wait_line
+    for job in [job_a, job_c, job_d]:
+        assert str(job.pass_fpath) not in wait_line
+        assert str(job.fail_fpath) not in wait_line
+    # The wait comes after "a" and before "c" in the worker script
+    assert (text.index('### Command 1 / 3 - a') < text.index(wait_line) <
+            text.index('### Command 3 / 3 - c'))
+    # "b" runs on its own worker, which has nothing to wait for
+    assert 'while ' not in worker_of['b'].finalize_text()
+
+    if not queue.is_available():
+        pytest.skip('Skip tmux test. Tmux is not available')
+    agg_state = queue.run(block=True, with_textual=False,
+                          other_session_handler='kill')
+    # A skipped job is also counted as failed
+    assert agg_state['failed'] == 2
+    assert agg_state['skipped'] == 1
+    assert agg_state['passed'] == 2
+    assert job_c.fail_fpath.exists()
+
+
+def test_job_cost_partitioning():
+    """
+    Jobs default to unit weight, and a larger cost changes how the
+    independent jobs are split between workers.
+    """
+    import cmd_queue
+
+    def worker_names(costs):
+        queue = cmd_queue.Queue.create(backend='tmux', size=2,
+                                       name='test_job_cost_partitioning')
+        for idx, cost in enumerate(costs):
+            kwargs = {} if cost is None else {'cost': cost}
+            queue.submit('true', name=f'job{idx}', **kwargs)
+        queue.order_jobs()
+        return sorted(sorted(job.name for job in worker.jobs)
+                      for worker in queue.workers)
+
+    default = worker_names([None, None, None, None])
+    assert default == worker_names([1, 1, 1, 1])
+    assert sorted(map(len, default)) == [2, 2]
+
+    weighted = worker_names([3, None, None, None])
+    assert weighted == [['job0'], ['job1', 'job2', 'job3']]
+
+    queue = cmd_queue.Queue.create(backend='tmux')
+    assert queue.submit('true').cost is None
+    assert queue.submit('true', cost=2.5).cost == 2.5
+
+
+def test_split_gpus():
+    """
+    By default each worker sees a single GPU. With split_gpus extra GPUs are
+    divided between the workers.
+    """
+    import cmd_queue
+
+    def worker_gpus(**kwargs):
+        queue = cmd_queue.Queue.create(backend='tmux', size=2,
+                                       name='test_split_gpus', **kwargs)
+        queue.submit('true', name='job1')
+        queue.submit('true', name='job2')
+        queue.order_jobs()
+        return [worker.environ['CUDA_VISIBLE_DEVICES']
+                for worker in queue.workers]
+
+    assert worker_gpus(gpus=[0, 1, 2]) == ['0', '1']
+    assert worker_gpus(gpus=[0, 1, 2], split_gpus=True) == ['0', '1,2']
+    # Without extra GPUs the split is the same as the default
+    assert worker_gpus(gpus=[3], split_gpus=True) == ['3', '3']